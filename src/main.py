@@ -4,13 +4,14 @@ Main entry point for the Academic Activity Report Generator
 
 import sys
 import os
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QTranslator, QLocale
-from src.ui.main_window import MainWindow
-from src.services.database import DatabaseService
 
 def main():
     """Main application entry point"""
+    # Qt and the UI are imported here so importing this module stays cheap
+    from PyQt5.QtWidgets import QApplication
+    from src.ui.main_window import MainWindow
+    from src.services.database import DatabaseService
+
     app = QApplication(sys.argv)
 
     # Set application properties
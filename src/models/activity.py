@@ -6,7 +6,9 @@ from dataclasses import dataclass
 from datetime import date, time
 from typing import Optional
 
-@dataclass
+from .base import field_names
+
+@dataclass(slots=True)
 class Activity:
     activity_type: str
     start_date: date
@@ -32,19 +34,4 @@ class Activity:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for database operations"""
-        return {
-            'id': self.id,
-            'activity_type': self.activity_type,
-            'sub_category': self.sub_category,
-            'sub_category_other': self.sub_category_other,
-            'start_date': self.start_date.isoformat() if self.start_date else None,
-            'end_date': self.end_date.isoformat() if self.end_date else None,
-            'start_time': self.start_time.isoformat() if self.start_time else None,
-            'end_time': self.end_time.isoformat() if self.end_time else None,
-            'venue': self.venue,
-            'collaboration_sponsor': self.collaboration_sponsor,
-            'highlights': self.highlights,
-            'key_takeaway': self.key_takeaway,
-            'summary': self.summary,
-            'follow_up_plan': self.follow_up_plan
-        }
\ No newline at end of file
+        return {name: getattr(self, name) for name in field_names(type(self))}
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""
+Shared helpers for data models
+"""
+
+from dataclasses import fields
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def field_names(cls) -> tuple:
+    """Get dataclass field names (computed once per class)"""
+    return tuple(f.name for f in fields(cls))
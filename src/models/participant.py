@@ -5,28 +5,33 @@ Participant data model
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+from .base import field_names
+from ..utils.constants import PARTICIPANT_TYPE_DISPLAY
+
+@dataclass(slots=True)
 class Participant:
     participant_type: str  # 'faculty', 'student', 'research_scholar'
     count: int
     activity_id: int
     id: Optional[int] = None
 
+    # Column order of the parameter tuples built by to_row()
+    ROW_COLUMNS = ('id', 'activity_id', 'participant_type', 'count')
+
     @property
     def display_type(self) -> str:
         """Get formatted participant type display"""
-        type_mapping = {
-            'faculty': 'Faculty',
-            'student': 'Students',
-            'research_scholar': 'Research Scholars'
-        }
-        return type_mapping.get(self.participant_type, self.participant_type.title())
+        return PARTICIPANT_TYPE_DISPLAY.get(self.participant_type) or self.participant_type.title()
 
     def to_dict(self) -> dict:
         """Convert to dictionary for database operations"""
-        return {
-            'id': self.id,
-            'activity_id': self.activity_id,
-            'participant_type': self.participant_type,
-            'count': self.count
-        }
\ No newline at end of file
+        return {name: getattr(self, name) for name in field_names(type(self))}
+
+    def to_row(self, activity_id: Optional[int] = None) -> tuple:
+        """Convert to a parameter tuple ordered as ROW_COLUMNS for executemany"""
+        return (
+            self.id,
+            self.activity_id if activity_id is None else activity_id,
+            self.participant_type,
+            self.count
+        )
\ No newline at end of file
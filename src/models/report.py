@@ -5,7 +5,9 @@ Report data model for combining all activity-related data
 from dataclasses import dataclass
 from typing import List, Optional
 
-@dataclass
+from .base import field_names
+
+@dataclass(slots=True)
 class ReportPreparer:
     name: str
     activity_id: int
@@ -13,17 +15,24 @@ class ReportPreparer:
     signature_image_path: Optional[str] = None
     id: Optional[int] = None
 
+    # Column order of the parameter tuples built by to_row()
+    ROW_COLUMNS = ('id', 'activity_id', 'name', 'designation', 'signature_image_path')
+
     def to_dict(self) -> dict:
         """Convert to dictionary for database operations"""
-        return {
-            'id': self.id,
-            'activity_id': self.activity_id,
-            'name': self.name,
-            'designation': self.designation,
-            'signature_image_path': self.signature_image_path
-        }
+        return {name: getattr(self, name) for name in field_names(type(self))}
 
-@dataclass
+    def to_row(self, activity_id: Optional[int] = None) -> tuple:
+        """Convert to a parameter tuple ordered as ROW_COLUMNS for executemany"""
+        return (
+            self.id,
+            self.activity_id if activity_id is None else activity_id,
+            self.name,
+            self.designation,
+            self.signature_image_path
+        )
+
+@dataclass(slots=True)
 class ActivityPhoto:
     photo_path: str
     activity_id: int
@@ -31,15 +40,22 @@ class ActivityPhoto:
     caption: Optional[str] = None
     id: Optional[int] = None
 
+    # Column order of the parameter tuples built by to_row()
+    ROW_COLUMNS = ('id', 'activity_id', 'photo_path', 'photo_type', 'caption')
+
     def to_dict(self) -> dict:
         """Convert to dictionary for database operations"""
-        return {
-            'id': self.id,
-            'activity_id': self.activity_id,
-            'photo_path': self.photo_path,
-            'photo_type': self.photo_type,
-            'caption': self.caption
-        }
+        return {name: getattr(self, name) for name in field_names(type(self))}
+
+    def to_row(self, activity_id: Optional[int] = None) -> tuple:
+        """Convert to a parameter tuple ordered as ROW_COLUMNS for executemany"""
+        return (
+            self.id,
+            self.activity_id if activity_id is None else activity_id,
+            self.photo_path,
+            self.photo_type,
+            self.caption
+        )
 
 @dataclass
 class ActivityReport:
@@ -59,16 +75,16 @@ class ActivityReport:
         if not self.activity.get('start_date'):
             errors.append("Start date is required")
 
-        if len(self.speakers) == 0:
+        if not self.speakers:
             errors.append("At least one speaker is required")
 
-        if len(self.participants) == 0:
+        if not self.participants:
             errors.append("At least one participant type is required")
 
         if len(self.photos) < 2:
             errors.append("At least 2 activity photos are required for PDF generation")
 
-        if len(self.report_preparers) == 0:
+        if not self.report_preparers:
             errors.append("At least one report preparer is required")
 
         return errors
\ No newline at end of file
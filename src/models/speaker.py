@@ -5,7 +5,9 @@ Speaker data model
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+from .base import field_names
+
+@dataclass(slots=True)
 class Speaker:
     name: str
     activity_id: int
@@ -17,6 +19,12 @@ class Speaker:
     profile_text: Optional[str] = None
     id: Optional[int] = None
 
+    # Column order of the parameter tuples built by to_row()
+    ROW_COLUMNS = (
+        'id', 'activity_id', 'name', 'title_position', 'organization',
+        'contact_info', 'presentation_title', 'profile_image_path', 'profile_text'
+    )
+
     @property
     def display_name(self) -> str:
         """Get formatted speaker display name"""
@@ -34,14 +42,18 @@ class Speaker:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for database operations"""
-        return {
-            'id': self.id,
-            'activity_id': self.activity_id,
-            'name': self.name,
-            'title_position': self.title_position,
-            'organization': self.organization,
-            'contact_info': self.contact_info,
-            'presentation_title': self.presentation_title,
-            'profile_image_path': self.profile_image_path,
-            'profile_text': self.profile_text
-        }
\ No newline at end of file
+        return {name: getattr(self, name) for name in field_names(type(self))}
+
+    def to_row(self, activity_id: Optional[int] = None) -> tuple:
+        """Convert to a parameter tuple ordered as ROW_COLUMNS for executemany"""
+        return (
+            self.id,
+            self.activity_id if activity_id is None else activity_id,
+            self.name,
+            self.title_position,
+            self.organization,
+            self.contact_info,
+            self.presentation_title,
+            self.profile_image_path,
+            self.profile_text
+        )
\ No newline at end of file
@@ -4,8 +4,96 @@ Complete database service for managing SQLite database operations
 
 import sqlite3
 import os
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+import threading
+from contextlib import contextmanager
+from datetime import date, time
+from typing import List, Optional, Dict, Any, Union
+
+from ..models.speaker import Speaker
+from ..models.participant import Participant
+from ..models.report import ReportPreparer, ActivityPhoto
+
+# Bind date/time values as ISO strings so models can be passed without pre-converting
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(time, time.isoformat)
+
+def _placeholders(count: int) -> str:
+    """Build a comma-separated list of ? placeholders"""
+    return ', '.join('?' * count)
+
+def _dict_row_factory(cursor: sqlite3.Cursor, row: tuple) -> Dict[str, Any]:
+    """Build result rows directly as dicts (callers use dict access such as .get())"""
+    return dict(zip([column[0] for column in cursor.description], row))
+
+def _upsert_sql(table: str, columns: tuple) -> str:
+    """Build an upsert for a child table whose columns start with (id, activity_id)"""
+    updates = ', '.join(f'{column}=excluded.{column}' for column in columns[2:])
+    return (
+        f'INSERT INTO {table} ({", ".join(columns)}) VALUES ({_placeholders(len(columns))}) '
+        f'ON CONFLICT(id) DO UPDATE SET {updates} '
+        f'WHERE {table}.activity_id=excluded.activity_id'
+    )
+
+def _delete_stale_sql(table: str) -> str:
+    """Build a delete of a child table's rows for one activity, left with a {} for the kept id placeholders"""
+    return f'DELETE FROM {table} WHERE activity_id=? AND id NOT IN ({{}})'
+
+def _release_foreign_ids(conn: sqlite3.Connection, table: str, activity_id: int, rows: list) -> list:
+    """Clear row ids not owned by this activity so those rows are inserted as new ones"""
+    if all(row[0] is None for row in rows):
+        return rows
+    owned_ids = {row['id'] for row in conn.execute(_SELECT_OWNED_IDS_SQL.format(table), (activity_id,))}
+    return [row if row[0] is None or row[0] in owned_ids else (None, *row[1:]) for row in rows]
+
+def _replace_children(conn: sqlite3.Connection, table: str, activity_id: int, rows: list):
+    """Make a child table's rows for an activity match rows (tuples ordered as the model's ROW_COLUMNS)"""
+    upsert_sql, delete_stale_sql = _CHILD_TABLE_SQL[table]
+    rows = _release_foreign_ids(conn, table, activity_id, rows)
+    kept_ids = [row[0] for row in rows if row[0] is not None]
+
+    # Drop rows no longer present, then upsert the rest (existing ids stay stable)
+    conn.execute(delete_stale_sql.format(_placeholders(len(kept_ids))), (activity_id, *kept_ids))
+    conn.executemany(upsert_sql, rows)
+
+# SQL statements, built once so each call reuses the same string for SQLite's statement cache
+_INSERT_ACTIVITY_SQL = '''
+    INSERT INTO activities (
+        activity_type, sub_category, sub_category_other,
+        start_date, end_date, start_time, end_time,
+        venue, collaboration_sponsor, highlights,
+        key_takeaway, summary, follow_up_plan
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_UPDATE_ACTIVITY_SQL = '''
+    UPDATE activities SET
+        activity_type=?, sub_category=?, sub_category_other=?,
+        start_date=?, end_date=?, start_time=?, end_time=?,
+        venue=?, collaboration_sponsor=?, highlights=?,
+        key_takeaway=?, summary=?, follow_up_plan=?,
+        updated_at=CURRENT_TIMESTAMP
+    WHERE id=?
+'''
+
+# (upsert, stale-row delete) for each child table, generated from the model's row columns
+_CHILD_TABLE_SQL = {
+    table: (_upsert_sql(table, columns), _delete_stale_sql(table))
+    for table, columns in (
+        ('speakers', Speaker.ROW_COLUMNS),
+        ('participants', Participant.ROW_COLUMNS),
+        ('report_preparers', ReportPreparer.ROW_COLUMNS),
+        ('activity_photos', ActivityPhoto.ROW_COLUMNS),
+    )
+}
+
+# Formatted with the child table name
+_SELECT_OWNED_IDS_SQL = 'SELECT id FROM {} WHERE activity_id=?'
+
+_SELECT_ACTIVITY_SQL = 'SELECT * FROM activities WHERE id=?'
+_SELECT_SPEAKERS_SQL = 'SELECT * FROM speakers WHERE activity_id=?'
+_SELECT_PARTICIPANTS_SQL = 'SELECT * FROM participants WHERE activity_id=?'
+_SELECT_REPORT_PREPARERS_SQL = 'SELECT * FROM report_preparers WHERE activity_id=?'
+_SELECT_ACTIVITY_PHOTOS_SQL = 'SELECT * FROM activity_photos WHERE activity_id=?'
 
 class DatabaseService:
     def __init__(self, db_path: str = None):
@@ -15,17 +103,74 @@ class DatabaseService:
         self.db_path = db_path
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
+        # Single long-lived connection shared by all operations (and the PDF worker thread)
+        self._conn = None
+        self._lock = threading.RLock()
+
     def get_connection(self):
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get the shared database connection, opening it on first use"""
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+                conn.row_factory = _dict_row_factory
+
+                # Per-connection tuning; journal_mode=WAL is persisted by initialize_database
+                conn.executescript('''
+                    PRAGMA synchronous=NORMAL;
+                    PRAGMA temp_store=MEMORY;
+                    PRAGMA cache_size=-20000;
+                    PRAGMA busy_timeout=5000;
+                    PRAGMA foreign_keys=ON;
+                ''')
+                self._conn = conn
+            return self._conn
+
+    @contextmanager
+    def transaction(self):
+        """Run a block of statements in one transaction (nested blocks join the outer one)"""
+        with self._lock:
+            conn = self.get_connection()
+            if conn.in_transaction:
+                yield conn
+                return
+
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except Exception:
+                # SQLite already rolls back on some errors (e.g. SQLITE_FULL, RAISE(ROLLBACK))
+                if conn.in_transaction:
+                    conn.execute('ROLLBACK')
+                raise
+
+            try:
+                conn.execute('COMMIT')
+            except Exception:
+                # A failed COMMIT leaves the transaction open; close it so later ones can start
+                if conn.in_transaction:
+                    conn.execute('ROLLBACK')
+                raise
+
+    def close(self):
+        """Close the shared database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def initialize_database(self):
-        """Create all database tables"""
-        with self.get_connection() as conn:
-            # Activities table
-            conn.execute('''
+        """Create all database tables and indexes"""
+        with self._lock:
+            conn = self.get_connection()
+
+            # Write-ahead logging is stored in the database file, so set it once here
+            conn.execute('PRAGMA journal_mode=WAL')
+
+            # All schema DDL runs as one script inside a single transaction
+            conn.executescript('''
+                BEGIN;
+
+                -- Activities table
                 CREATE TABLE IF NOT EXISTS activities (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     activity_type VARCHAR(50) NOT NULL,
@@ -43,11 +188,9 @@ class DatabaseService:
                     follow_up_plan TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
+                );
 
-            # Speakers table
-            conn.execute('''
+                -- Speakers table
                 CREATE TABLE IF NOT EXISTS speakers (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     activity_id INTEGER NOT NULL,
@@ -59,22 +202,18 @@ class DatabaseService:
                     profile_image_path VARCHAR(500),
                     profile_text TEXT,
                     FOREIGN KEY (activity_id) REFERENCES activities(id) ON DELETE CASCADE
-                )
-            ''')
+                );
 
-            # Participants table
-            conn.execute('''
+                -- Participants table
                 CREATE TABLE IF NOT EXISTS participants (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     activity_id INTEGER NOT NULL,
                     participant_type VARCHAR(20) NOT NULL,
                     count INTEGER NOT NULL,
                     FOREIGN KEY (activity_id) REFERENCES activities(id) ON DELETE CASCADE
-                )
-            ''')
+                );
 
-            # Report preparers table
-            conn.execute('''
+                -- Report preparers table
                 CREATE TABLE IF NOT EXISTS report_preparers (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     activity_id INTEGER NOT NULL,
@@ -82,11 +221,9 @@ class DatabaseService:
                     designation VARCHAR(100),
                     signature_image_path VARCHAR(500),
                     FOREIGN KEY (activity_id) REFERENCES activities(id) ON DELETE CASCADE
-                )
-            ''')
+                );
 
-            # Activity photos table
-            conn.execute('''
+                -- Activity photos table
                 CREATE TABLE IF NOT EXISTS activity_photos (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     activity_id INTEGER NOT NULL,
@@ -94,26 +231,24 @@ class DatabaseService:
                     photo_type VARCHAR(20) DEFAULT 'activity',
                     caption TEXT,
                     FOREIGN KEY (activity_id) REFERENCES activities(id) ON DELETE CASCADE
-                )
-            ''')
+                );
 
-            conn.commit()
+                -- Child rows are always looked up by their activity
+                CREATE INDEX IF NOT EXISTS idx_speakers_activity ON speakers(activity_id);
+                CREATE INDEX IF NOT EXISTS idx_participants_activity ON participants(activity_id);
+                CREATE INDEX IF NOT EXISTS idx_report_preparers_activity ON report_preparers(activity_id);
+                CREATE INDEX IF NOT EXISTS idx_activity_photos_activity ON activity_photos(activity_id);
+
+                COMMIT;
+            ''')
 
     def save_activity(self, activity_data: Dict[str, Any]) -> int:
         """Save or update activity data"""
-        with self.get_connection() as conn:
+        with self.transaction() as conn:
             if 'id' in activity_data and activity_data['id']:
                 # Update existing activity
                 activity_id = activity_data['id']
-                conn.execute('''
-                    UPDATE activities SET
-                        activity_type=?, sub_category=?, sub_category_other=?,
-                        start_date=?, end_date=?, start_time=?, end_time=?,
-                        venue=?, collaboration_sponsor=?, highlights=?,
-                        key_takeaway=?, summary=?, follow_up_plan=?,
-                        updated_at=?
-                    WHERE id=?
-                ''', (
+                conn.execute(_UPDATE_ACTIVITY_SQL, (
                     activity_data.get('activity_type'),
                     activity_data.get('sub_category'),
                     activity_data.get('sub_category_other'),
@@ -127,19 +262,11 @@ class DatabaseService:
                     activity_data.get('key_takeaway'),
                     activity_data.get('summary'),
                     activity_data.get('follow_up_plan'),
-                    datetime.now(),
                     activity_id
                 ))
             else:
                 # Insert new activity
-                cursor = conn.execute('''
-                    INSERT INTO activities (
-                        activity_type, sub_category, sub_category_other,
-                        start_date, end_date, start_time, end_time,
-                        venue, collaboration_sponsor, highlights,
-                        key_takeaway, summary, follow_up_plan
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                cursor = conn.execute(_INSERT_ACTIVITY_SQL, (
                     activity_data.get('activity_type'),
                     activity_data.get('sub_category'),
                     activity_data.get('sub_category_other'),
@@ -156,139 +283,131 @@ class DatabaseService:
                 ))
                 activity_id = cursor.lastrowid
 
-            conn.commit()
             return activity_id
 
-    def save_speakers(self, activity_id: int, speakers: List[Dict[str, Any]]):
+    def save_speakers(self, activity_id: int, speakers: List[Union[Speaker, Dict[str, Any]]]):
         """Save speaker data for an activity"""
-        with self.get_connection() as conn:
-            # Remove existing speakers for this activity
-            conn.execute('DELETE FROM speakers WHERE activity_id=?', (activity_id,))
-
-            # Insert new speakers
-            for speaker in speakers:
-                conn.execute('''
-                    INSERT INTO speakers (
-                        activity_id, name, title_position, organization,
-                        contact_info, presentation_title, profile_image_path, profile_text
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    activity_id,
-                    speaker.get('name'),
-                    speaker.get('title_position'),
-                    speaker.get('organization'),
-                    speaker.get('contact_info'),
-                    speaker.get('presentation_title'),
-                    speaker.get('profile_image_path'),
-                    speaker.get('profile_text')
-                ))
-
-            conn.commit()
-
-    def save_participants(self, activity_id: int, participants: List[Dict[str, Any]]):
+        rows = [
+            speaker.to_row(activity_id) if isinstance(speaker, Speaker) else (
+                speaker.get('id'),
+                activity_id,
+                speaker.get('name'),
+                speaker.get('title_position'),
+                speaker.get('organization'),
+                speaker.get('contact_info'),
+                speaker.get('presentation_title'),
+                speaker.get('profile_image_path'),
+                speaker.get('profile_text')
+            )
+            for speaker in speakers
+        ]
+
+        with self.transaction() as conn:
+            _replace_children(conn, 'speakers', activity_id, rows)
+
+    def save_participants(self, activity_id: int, participants: List[Union[Participant, Dict[str, Any]]]):
         """Save participant data for an activity"""
-        with self.get_connection() as conn:
-            # Remove existing participants for this activity
-            conn.execute('DELETE FROM participants WHERE activity_id=?', (activity_id,))
-
-            # Insert new participants
-            for participant in participants:
-                conn.execute('''
-                    INSERT INTO participants (activity_id, participant_type, count)
-                    VALUES (?, ?, ?)
-                ''', (
-                    activity_id,
-                    participant.get('participant_type'),
-                    participant.get('count')
-                ))
-
-            conn.commit()
-
-    def save_report_preparers(self, activity_id: int, preparers: List[Dict[str, Any]]):
+        rows = [
+            participant.to_row(activity_id) if isinstance(participant, Participant) else (
+                participant.get('id'),
+                activity_id,
+                participant.get('participant_type'),
+                participant.get('count')
+            )
+            for participant in participants
+        ]
+
+        with self.transaction() as conn:
+            _replace_children(conn, 'participants', activity_id, rows)
+
+    def save_report_preparers(self, activity_id: int, preparers: List[Union[ReportPreparer, Dict[str, Any]]]):
         """Save report preparer data for an activity"""
-        with self.get_connection() as conn:
-            # Remove existing preparers for this activity
-            conn.execute('DELETE FROM report_preparers WHERE activity_id=?', (activity_id,))
-
-            # Insert new preparers
-            for preparer in preparers:
-                conn.execute('''
-                    INSERT INTO report_preparers (
-                        activity_id, name, designation, signature_image_path
-                    ) VALUES (?, ?, ?, ?)
-                ''', (
-                    activity_id,
-                    preparer.get('name'),
-                    preparer.get('designation'),
-                    preparer.get('signature_image_path')
-                ))
-
-            conn.commit()
-
-    def save_activity_photos(self, activity_id: int, photos: List[Dict[str, Any]]):
+        rows = [
+            preparer.to_row(activity_id) if isinstance(preparer, ReportPreparer) else (
+                preparer.get('id'),
+                activity_id,
+                preparer.get('name'),
+                preparer.get('designation'),
+                preparer.get('signature_image_path')
+            )
+            for preparer in preparers
+        ]
+
+        with self.transaction() as conn:
+            _replace_children(conn, 'report_preparers', activity_id, rows)
+
+    def save_activity_photos(self, activity_id: int, photos: List[Union[ActivityPhoto, Dict[str, Any]]]):
         """Save activity photo data for an activity"""
-        with self.get_connection() as conn:
-            # Remove existing photos for this activity
-            conn.execute('DELETE FROM activity_photos WHERE activity_id=?', (activity_id,))
-
-            # Insert new photos
-            for photo in photos:
-                conn.execute('''
-                    INSERT INTO activity_photos (activity_id, photo_path, photo_type, caption)
-                    VALUES (?, ?, ?, ?)
-                ''', (
-                    activity_id,
-                    photo.get('photo_path'),
-                    photo.get('photo_type', 'activity'),
-                    photo.get('caption')
-                ))
-
-            conn.commit()
+        rows = [
+            photo.to_row(activity_id) if isinstance(photo, ActivityPhoto) else (
+                photo.get('id'),
+                activity_id,
+                photo.get('photo_path'),
+                photo.get('photo_type', 'activity'),
+                photo.get('caption')
+            )
+            for photo in photos
+        ]
+
+        with self.transaction() as conn:
+            _replace_children(conn, 'activity_photos', activity_id, rows)
+
+    def save_full_report(self, report_data: Dict[str, Any]) -> int:
+        """Save activity and all related data in a single transaction"""
+        with self.transaction():
+            activity_id = self.save_activity(report_data.get('activity', {}))
+            self.save_speakers(activity_id, report_data.get('speakers', []))
+            self.save_participants(activity_id, report_data.get('participants', []))
+            self.save_report_preparers(activity_id, report_data.get('report_preparers', []))
+            self.save_activity_photos(activity_id, report_data.get('photos', []))
+
+        return activity_id
 
     def get_full_activity_data(self, activity_id: int) -> Optional[Dict[str, Any]]:
         """Get complete activity data including all related tables"""
-        activity = self.get_activity(activity_id)
-        if not activity:
-            return None
-
-        return {
-            'activity': dict(activity),
-            'speakers': self.get_speakers(activity_id),
-            'participants': self.get_participants(activity_id),
-            'report_preparers': self.get_report_preparers(activity_id),
-            'photos': self.get_activity_photos(activity_id)
-        }
+        # Run all five reads back to back on the shared connection under one lock
+        with self._lock:
+            conn = self.get_connection()
+            params = (activity_id,)
+
+            activity = conn.execute(_SELECT_ACTIVITY_SQL, params).fetchone()
+            if not activity:
+                return None
+
+            return {
+                'activity': activity,
+                'speakers': conn.execute(_SELECT_SPEAKERS_SQL, params).fetchall(),
+                'participants': conn.execute(_SELECT_PARTICIPANTS_SQL, params).fetchall(),
+                'report_preparers': conn.execute(_SELECT_REPORT_PREPARERS_SQL, params).fetchall(),
+                'photos': conn.execute(_SELECT_ACTIVITY_PHOTOS_SQL, params).fetchall()
+            }
 
     def get_activity(self, activity_id: int) -> Optional[Dict[str, Any]]:
         """Get activity data by ID"""
-        with self.get_connection() as conn:
-            cursor = conn.execute('SELECT * FROM activities WHERE id=?', (activity_id,))
-            activity = cursor.fetchone()
-
-            if activity:
-                return dict(activity)
-            return None
+        with self._lock:
+            cursor = self.get_connection().execute(_SELECT_ACTIVITY_SQL, (activity_id,))
+            return cursor.fetchone()
 
     def get_speakers(self, activity_id: int) -> List[Dict[str, Any]]:
         """Get all speakers for an activity"""
-        with self.get_connection() as conn:
-            cursor = conn.execute('SELECT * FROM speakers WHERE activity_id=?', (activity_id,))
-            return [dict(row) for row in cursor.fetchall()]
+        with self._lock:
+            cursor = self.get_connection().execute(_SELECT_SPEAKERS_SQL, (activity_id,))
+            return cursor.fetchall()
 
     def get_participants(self, activity_id: int) -> List[Dict[str, Any]]:
         """Get all participants for an activity"""
-        with self.get_connection() as conn:
-            cursor = conn.execute('SELECT * FROM participants WHERE activity_id=?', (activity_id,))
-            return [dict(row) for row in cursor.fetchall()]
+        with self._lock:
+            cursor = self.get_connection().execute(_SELECT_PARTICIPANTS_SQL, (activity_id,))
+            return cursor.fetchall()
 
     def get_report_preparers(self, activity_id: int) -> List[Dict[str, Any]]:
         """Get all report preparers for an activity"""
-        with self.get_connection() as conn:
-            cursor = conn.execute('SELECT * FROM report_preparers WHERE activity_id=?', (activity_id,))
-            return [dict(row) for row in cursor.fetchall()]
+        with self._lock:
+            cursor = self.get_connection().execute(_SELECT_REPORT_PREPARERS_SQL, (activity_id,))
+            return cursor.fetchall()
 
     def get_activity_photos(self, activity_id: int) -> List[Dict[str, Any]]:
         """Get all activity photos"""
-        with self.get_connection() as conn:
-            cursor = conn.execute('SELECT * FROM activity_photos WHERE activity_id=?', (activity_id,))
-            return [dict(row) for row in cursor.fetchall()]
\ No newline at end of file
+        with self._lock:
+            cursor = self.get_connection().execute(_SELECT_ACTIVITY_PHOTOS_SQL, (activity_id,))
+            return cursor.fetchall()
\ No newline at end of file
@@ -4,19 +4,51 @@ Complete File management service
 
 import os
 import shutil
-import uuid
-from datetime import datetime
+import itertools
+import time
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 from PIL import Image
 import hashlib
+import sys
+
+# Linux ioctl request that clones a whole file copy-on-write (reflink)
+FICLONE = 0x40049409
+
+if sys.platform.startswith('linux'):
+    import fcntl
+else:
+    fcntl = None
+
+# Leading bytes of common image formats, mapped to their Pillow format name
+IMAGE_SIGNATURES = {
+    b'\xff\xd8\xff': 'JPEG',
+    b'\x89PNG\r\n\x1a\n': 'PNG',
+    b'GIF87a': 'GIF', b'GIF89a': 'GIF',
+    b'BM': 'BMP',
+    b'II*\x00': 'TIFF', b'MM\x00*': 'TIFF'
+}
+
+# Default storage root, resolved once at import
+DEFAULT_BASE_DIR = Path(__file__).parent / '../../data'
 
 class FileManagerService:
     """Service for managing file operations including uploads, storage, and organization"""
 
+    # Extensions Pillow can open (e.g. '.jpg'), resolved once at import
+    IMAGE_EXTENSIONS = frozenset(Image.registered_extensions())
+
+    # Directories already created by any instance in this process
+    _created_dirs = set()
+
+    # Process-wide sequence number used in generated filenames
+    _filename_counter = itertools.count()
+
     def __init__(self, base_dir: str = None):
         if base_dir is None:
-            base_dir = os.path.join(os.path.dirname(__file__), '../../data')
+            base_dir = DEFAULT_BASE_DIR
 
         self.base_dir = Path(base_dir)
         self.setup_directories()
@@ -32,8 +64,15 @@ class FileManagerService:
         ]
 
         for directory in directories:
-            dir_path = self.base_dir / directory
-            dir_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(self.base_dir / directory)
+
+    def _ensure_dir(self, dir_path: Path):
+        """Create a directory once per process"""
+        if dir_path in self._created_dirs:
+            return
+
+        dir_path.mkdir(parents=True, exist_ok=True)
+        self._created_dirs.add(dir_path)
 
     def get_directory_path(self, file_type: str, activity_id: Optional[int] = None) -> Path:
         """Get appropriate directory path for file type"""
@@ -57,8 +96,8 @@ class FileManagerService:
     def generate_unique_filename(self, original_filename: str, prefix: str = "") -> str:
         """Generate unique filename while preserving extension"""
         name, ext = os.path.splitext(original_filename)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
+        timestamp = int(time.time())
+        unique_id = f"{next(self._filename_counter):x}{os.urandom(4).hex()}"
 
         if prefix:
             return f"{prefix}_{timestamp}_{unique_id}{ext}"
@@ -73,14 +112,23 @@ class FileManagerService:
             Dict with validation results
         """
         try:
-            if not os.path.exists(file_path):
+            # Reject unknown extensions before touching the file
+            if os.path.splitext(file_path)[1].lower() not in self.IMAGE_EXTENSIONS:
+                return {
+                    'valid': False,
+                    'error': 'Unsupported file extension'
+                }
+
+            # Existence and size from a single stat() call
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
                 return {
                     'valid': False,
                     'error': 'File does not exist'
                 }
 
             # Check file size
-            file_size = os.path.getsize(file_path)
             max_size_bytes = max_size_mb * 1024 * 1024
 
             if file_size > max_size_bytes:
@@ -89,21 +137,23 @@ class FileManagerService:
                     'error': f'File size exceeds {max_size_mb}MB limit'
                 }
 
-            # Check if it's a valid image
+            # Check if it's a valid image: Pillow parses only the header for size/format
+            # (no full-file verify() walk). A known signature narrows which plugin is tried;
+            # other formats Pillow registers fall through to its usual probing.
             try:
-                with Image.open(file_path) as img:
-                    img.verify()
+                with open(file_path, 'rb') as f:
+                    format_hint = self._detect_image_format(f.read(12))
+                    f.seek(0)
+
+                    with Image.open(f, formats=[format_hint] if format_hint else None) as img:
+                        width, height = img.size
+                        format_name = img.format
             except Exception:
                 return {
                     'valid': False,
                     'error': 'Invalid image file format'
                 }
 
-            # Reopen to get image properties (verify() closes the file)
-            with Image.open(file_path) as img:
-                width, height = img.size
-                format_name = img.format
-
             return {
                 'valid': True,
                 'width': width,
@@ -119,6 +169,35 @@ class FileManagerService:
                 'error': f'Validation error: {str(e)}'
             }
 
+    def validate_image_files(self, file_paths: List[str], max_size_mb: int = 5,
+                             max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Validate many image files using a pool of worker processes
+
+        Returns:
+            List of validation result dicts, in the same order as file_paths
+        """
+        # Process start-up outweighs the work for small batches
+        if len(file_paths) < 8:
+            return [self.validate_image_file(path, max_size_mb) for path in file_paths]
+
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(file_paths) // (workers * 4))
+        validate = functools.partial(self.validate_image_file, max_size_mb=max_size_mb)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(validate, file_paths, chunksize=chunksize))
+
+    def _detect_image_format(self, header: bytes) -> Optional[str]:
+        """Match leading file bytes against known image signatures"""
+        for signature, format_name in IMAGE_SIGNATURES.items():
+            if header.startswith(signature):
+                return format_name
+        # WebP is a RIFF container tagged 'WEBP' at offset 8
+        if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+            return 'WEBP'
+        return None
+
     def save_uploaded_file(self, source_path: str, file_type: str, activity_id: Optional[int] = None) -> Optional[str]:
         """
         Save uploaded file to appropriate location
@@ -129,7 +208,7 @@ class FileManagerService:
         try:
             # Get target directory
             target_dir = self.get_directory_path(file_type, activity_id)
-            target_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(target_dir)
 
             # Generate unique filename
             original_name = os.path.basename(source_path)
@@ -138,7 +217,13 @@ class FileManagerService:
 
             # Copy file to target location
             target_path = target_dir / unique_filename
-            shutil.copy2(source_path, target_path)
+            try:
+                self._copy_file(source_path, target_path)
+            except FileNotFoundError:
+                # The cached directory may have been removed since; recreate it and retry once
+                self._created_dirs.discard(target_dir)
+                self._ensure_dir(target_dir)
+                self._copy_file(source_path, target_path)
 
             return str(target_path)
 
@@ -146,6 +231,21 @@ class FileManagerService:
             print(f"Error saving file: {str(e)}")
             return None
 
+    def _copy_file(self, source_path: str, target_path: Path):
+        """Copy a file, cloning it copy-on-write where the filesystem supports it"""
+        if fcntl is not None:
+            try:
+                with open(source_path, 'rb') as src, open(target_path, 'wb') as dst:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                shutil.copystat(source_path, target_path)
+                return
+            except OSError:
+                # No reflink support (e.g. ext4 or cross-device); fall back to a regular copy
+                pass
+
+        # copy2 uses in-kernel sendfile on Linux for the data copy
+        shutil.copy2(source_path, target_path)
+
     def get_prefix_for_file_type(self, file_type: str, activity_id: Optional[int] = None) -> str:
         """Get prefix for filename based on file type"""
         prefixes = {
@@ -3,140 +3,30 @@ Complete PDF generation service using WeasyPrint
 """
 
 import os
+import asyncio
+import functools
 import tempfile
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, Optional
-from weasyprint import HTML, CSS
+from weasyprint import HTML
 from weasyprint.text.fonts import FontConfiguration
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import (
+    ChoiceLoader, DictLoader, Environment, FileSystemBytecodeCache, FileSystemLoader
+)
 from PIL import Image
 
-from ..utils.constants import UNIVERSITY_INFO
+try:
+    import minijinja
+except ImportError:
+    minijinja = None
 
-class PDFGeneratorService:
-    """Service for generating PDF reports using WeasyPrint"""
-
-    def __init__(self, template_dir: str = None):
-        if template_dir is None:
-            template_dir = os.path.join(os.path.dirname(__file__), '../templates')
-
-        self.template_dir = template_dir
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=True
-        )
-
-        # Add custom filters
-        self.jinja_env.filters['nl2br'] = self.nl2br_filter
-        self.jinja_env.filters['date'] = self.date_filter
-
-        # Font configuration
-        self.font_config = FontConfiguration()
-
-    def nl2br_filter(self, text):
-        """Convert newlines to <br> tags"""
-        if not text:
-            return ""
-        return text.replace('\n', '<br>')
-
-    def date_filter(self, date_str, format_str="j F Y"):
-        """Format date string"""
-        if not date_str:
-            return ""
-        try:
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            return date_obj.strftime(format_str)
-        except:
-            return date_str
+from ..utils.constants import UNIVERSITY_INFO, PARTICIPANT_TYPE_DISPLAY
 
-    def generate_pdf(self, activity_data: Dict[str, Any], output_path: str, options: Dict[str, Any] = None) -> bool:
-        """
-        Generate PDF report for activity
-
-        Args:
-            activity_data: Complete activity data including all related tables
-            output_path: Path where PDF should be saved
-            options: PDF generation options
-
-        Returns:
-            bool: True if successful, False otherwise
-        """
-        try:
-            # Set default options
-            if options is None:
-                options = {
-                    'include_photos': True,
-                    'include_profiles': True,
-                    'include_signatures': True,
-                    'add_watermark': True,
-                    'add_page_numbers': True
-                }
 
-            # Prepare template data
-            template_data = self.prepare_template_data(activity_data, options)
-
-            # Generate HTML from template
-            html_content = self.render_template(template_data)
-
-            # Create temporary directory for image processing
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Process images and update HTML
-                html_content = self.process_images(html_content, temp_dir)
-
-                # Generate PDF
-                self.create_pdf_from_html(html_content, output_path)
-
-            return True
-
-        except Exception as e:
-            print(f"Error generating PDF: {str(e)}")
-            return False
-
-    def prepare_template_data(self, activity_data: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepare data for template rendering"""
-        activity = activity_data.get('activity', {})
-        speakers = activity_data.get('speakers', [])
-        participants = activity_data.get('participants', [])
-        report_preparers = activity_data.get('report_preparers', [])
-        photos = activity_data.get('photos', [])
-
-        # Enhance speaker data
-        enhanced_speakers = []
-        for speaker in speakers:
-            enhanced_speaker = dict(speaker)
-            enhanced_speaker['display_name'] = speaker.get('name', '')
-            enhanced_speakers.append(enhanced_speaker)
-
-        # Enhance participant data
-        enhanced_participants = []
-        for participant in participants:
-            enhanced_participant = dict(participant)
-            participant_type = participant.get('participant_type', '')
-            enhanced_participant['display_type'] = {
-                'faculty': 'Faculty',
-                'student': 'Students',
-                'research_scholar': 'Research Scholars'
-            }.get(participant_type, participant_type.title())
-            enhanced_participants.append(enhanced_participant)
-
-        return {
-            'university_name': UNIVERSITY_INFO['name'],
-            'school_name': UNIVERSITY_INFO['school'],
-            'department_name': UNIVERSITY_INFO['department'],
-            'activity': activity,
-            'speakers': enhanced_speakers,
-            'participants': enhanced_participants,
-            'report_preparers': report_preparers,
-            'photos': photos,
-            'options': options,
-            'generation_date': datetime.now().strftime("%d %B %Y")
-        }
-
-    def render_template(self, template_data: Dict[str, Any]) -> str:
-        """Render HTML template with data"""
-        try:
-            template_str = """
+# Report layout rendered for the PDF
+REPORT_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -274,11 +164,175 @@ class PDFGeneratorService:
 
 </body>
 </html>
-            """
-            
-            template = Template(template_str)
-            return template.render(**template_data)
+"""
+
+
+class PDFGeneratorService:
+    """Service for generating PDF reports using WeasyPrint"""
+
+    _font_config = None
+
+    def __init__(self, template_dir: str = None):
+        if template_dir is None:
+            template_dir = os.path.join(os.path.dirname(__file__), '../templates')
+
+        self.template_dir = template_dir
+        # Compiled templates are cached on disk and reused by new processes
+        self.jinja_env = Environment(
+            loader=ChoiceLoader([
+                DictLoader({'report.html': REPORT_TEMPLATE}),
+                FileSystemLoader(template_dir)
+            ]),
+            autoescape=True,
+            bytecode_cache=FileSystemBytecodeCache(),
+            auto_reload=False
+        )
+
+        # Add custom filters
+        self.jinja_env.filters['nl2br'] = self.nl2br_filter
+        self.jinja_env.filters['date'] = self.date_filter
+
+        # Compile the report template once instead of on every render
+        self._template = self.jinja_env.get_template('report.html')
+
+        # Render with MiniJinja when available, Jinja2 otherwise
+        self._mj_env = None
+        if minijinja is not None:
+            self._mj_env = minijinja.Environment(
+                templates={'report.html': REPORT_TEMPLATE},
+                filters={'nl2br': self.nl2br_filter, 'date': self.date_filter}
+            )
+
+        # Font configuration, shared so fontconfig is only probed once
+        if PDFGeneratorService._font_config is None:
+            PDFGeneratorService._font_config = FontConfiguration()
+        self.font_config = PDFGeneratorService._font_config
+
+        # Decoded images reused across renders
+        self._image_cache = {}
+
+        # Worker processes for generate_pdf_async, created on first use
+        self._pool = None
+
+    def nl2br_filter(self, text):
+        """Convert newlines to <br> tags"""
+        if not text:
+            return ""
+        return text.replace('\n', '<br>')
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def date_filter(date_str, format_str="j F Y"):
+        """Format date string"""
+        if not date_str:
+            return ""
+        try:
+            # Parse YYYY-MM-DD directly rather than through strptime
+            year, month, day = date_str.split('-')
+            date_obj = datetime(int(year), int(month), int(day))
+            return date_obj.strftime(format_str)
+        except (TypeError, ValueError, AttributeError):
+            return date_str
+
+    def generate_pdf(self, activity_data: Dict[str, Any], output_path: str, options: Dict[str, Any] = None) -> bool:
+        """
+        Generate PDF report for activity
+
+        Args:
+            activity_data: Complete activity data including all related tables
+            output_path: Path where PDF should be saved
+            options: PDF generation options
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            # Set default options
+            if options is None:
+                options = {
+                    'include_photos': True,
+                    'include_profiles': True,
+                    'include_signatures': True,
+                    'add_watermark': True,
+                    'add_page_numbers': True
+                }
+
+            # Prepare template data
+            template_data = self.prepare_template_data(activity_data, options)
+
+            # Generate HTML from template
+            html_content = self.render_template(template_data)
+
+            # Process images only when photos are part of the report
+            if options.get('include_photos', True):
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    html_content = self.process_images(html_content, temp_dir)
+
+            # Generate PDF
+            self.create_pdf_from_html(html_content, output_path)
+
+            return True
 
+        except Exception as e:
+            print(f"Error generating PDF: {str(e)}")
+            return False
+
+    async def generate_pdf_async(self, activity_data: Dict[str, Any], output_path: str,
+                                 options: Dict[str, Any] = None) -> bool:
+        """Generate PDF report in a worker process without blocking the event loop"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor()
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._pool, _generate_pdf_in_worker,
+            self.template_dir, activity_data, output_path, options
+        )
+
+    def close(self):
+        """Shut down the worker processes used by generate_pdf_async"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def prepare_template_data(self, activity_data: Dict[str, Any], options: Dict[str, Any]) -> Dict[str, Any]:
+        """Prepare data for template rendering"""
+        activity = activity_data.get('activity', {})
+        speakers = activity_data.get('speakers', [])
+        participants = activity_data.get('participants', [])
+        report_preparers = activity_data.get('report_preparers', [])
+        photos = activity_data.get('photos', [])
+
+        # Enhance participant data
+        display_type = PARTICIPANT_TYPE_DISPLAY.get
+        enhanced_participants = [
+            {
+                **participant,
+                'display_type': (display_type(participant.get('participant_type', ''))
+                                 or participant.get('participant_type', '').title())
+            }
+            for participant in participants
+        ]
+
+        return {
+            'university_name': UNIVERSITY_INFO['name'],
+            'school_name': UNIVERSITY_INFO['school'],
+            'department_name': UNIVERSITY_INFO['department'],
+            'activity': activity,
+            'speakers': speakers,
+            'participants': enhanced_participants,
+            'report_preparers': report_preparers,
+            'photos': photos,
+            'options': options,
+            'generation_date': datetime.now().strftime("%d %B %Y")
+        }
+
+    def render_template(self, template_data: Dict[str, Any]) -> str:
+        """Render HTML template with data"""
+        try:
+            if self._mj_env is not None:
+                return self._mj_env.render_template('report.html', **template_data)
+            return self._template.render(**template_data)
         except Exception as e:
             raise Exception(f"Template rendering error: {str(e)}")
 
@@ -288,33 +342,18 @@ class PDFGeneratorService:
         # In a full implementation, this would process images
         return html_content
 
-    def create_pdf_from_html(self, html_content: str, output_path: str):
-        """Create PDF from HTML content using WeasyPrint"""
+    def create_pdf_from_html(self, html_content: str, output_path: Optional[str] = None) -> Optional[bytes]:
+        """Create PDF from HTML content using WeasyPrint, returning bytes if no output path is given"""
         try:
             # Create HTML object
             html = HTML(string=html_content)
 
-            # Create CSS for PDF formatting
-            css = CSS(string='''
-                @page {
-                    size: A4;
-                    margin: 1in;
-                    @bottom-center {
-                        content: "Page " counter(page) " of " counter(pages);
-                        font-size: 10pt;
-                        font-family: "Times New Roman", serif;
-                    }
-                }
-                body {
-                    font-family: "Times New Roman", serif;
-                }
-            ''')
-
-            # Generate PDF
-            html.write_pdf(
+            # Generate PDF; page and body styles come from the template's
+            # inline <style>, and bytes are returned when output_path is None
+            return html.write_pdf(
                 output_path,
-                stylesheets=[css],
-                font_config=self.font_config
+                font_config=self.font_config,
+                cache=self._image_cache
             )
 
         except Exception as e:
@@ -354,18 +393,14 @@ class PDFGeneratorService:
         # Check participants
         if len(participants) == 0:
             errors.append("At least one participant type is required")
-        else:
-            for participant in participants:
-                if not participant.get('count', 0) > 0:
-                    errors.append("All participant counts must be greater than 0")
+        elif any(not participant.get('count', 0) > 0 for participant in participants):
+            errors.append("All participant counts must be greater than 0")
 
         # Check report preparers
         if len(report_preparers) == 0:
             errors.append("At least one report preparer is required")
-        else:
-            for preparer in report_preparers:
-                if not preparer.get('name'):
-                    errors.append("All report preparers must have names")
+        elif any(not preparer.get('name') for preparer in report_preparers):
+            errors.append("All report preparers must have names")
 
         # Check photos (warnings for now, as per planning minimum is 2)
         if len(photos) < 2:
@@ -375,4 +410,16 @@ class PDFGeneratorService:
             'valid': len(errors) == 0,
             'errors': errors,
             'warnings': warnings
-        }
\ No newline at end of file
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def _get_worker_service(template_dir: str) -> PDFGeneratorService:
+    """Return the generator service kept by this worker process"""
+    return PDFGeneratorService(template_dir)
+
+
+def _generate_pdf_in_worker(template_dir: str, activity_data: Dict[str, Any], output_path: str,
+                            options: Optional[Dict[str, Any]]) -> bool:
+    """Generate a PDF inside a worker process"""
+    return _get_worker_service(template_dir).generate_pdf(activity_data, output_path, options)
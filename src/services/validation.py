@@ -3,23 +3,100 @@ Complete Form validation service
 """
 
 import re
+import functools
 from datetime import datetime, date, time
 from typing import Dict, Any, List, Optional, Tuple
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+# ASCII whitespace plus the no-break and thin spaces that pasted numbers often carry
+_PHONE_STRIP_TABLE = str.maketrans('', '', ' \t\n\r\f\v\u00a0\u2009\u202f-()')
+
+
+def _parse_ymd(date_str: str) -> Optional[date]:
+    """Parse a zero-padded YYYY-MM-DD string by position, or return None if it has another shape"""
+    # isdigit() alone would also accept non-ASCII digits, which strptime rejects
+    digits = date_str[:4] + date_str[5:7] + date_str[8:]
+    if (len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-'
+            or not (digits.isascii() and digits.isdigit())):
+        return None
+    return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+
+
+def _parse_hm(time_str: str) -> Optional[time]:
+    """Parse a zero-padded HH:MM string by position, or return None if it has another shape"""
+    digits = time_str[:2] + time_str[3:]
+    if len(time_str) != 5 or time_str[2] != ':' or not (digits.isascii() and digits.isdigit()):
+        return None
+    return time(int(time_str[:2]), int(time_str[3:]))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_date(date_str: str, format_str: str = "%Y-%m-%d") -> date:
+    """Parse a date string, skipping strptime for the default format"""
+    if format_str == "%Y-%m-%d":
+        parsed = _parse_ymd(date_str)
+        if parsed is not None:
+            return parsed
+    return datetime.strptime(date_str, format_str).date()
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_time(time_str: str, format_str: str = "%H:%M") -> time:
+    """Parse a time string, skipping strptime for the default format"""
+    if format_str == "%H:%M":
+        parsed = _parse_hm(time_str)
+        if parsed is not None:
+            return parsed
+    return datetime.strptime(time_str, format_str).time()
+
+
+def _parse_or_none(parser, value: str):
+    """Return parser(value), or None if the value is not valid"""
+    try:
+        return parser(value)
+    except ValueError:
+        return None
+
+
+# Top-level report sections and the type each must have
+_REPORT_SECTIONS = (
+    ('activity', dict),
+    ('speakers', list),
+    ('participants', list),
+    ('report_preparers', list),
+    ('photos', list),
+)
+
+# (field, missing message or None if optional, parser, invalid format message) for each activity field
+_ACTIVITY_FIELDS = (
+    ('activity_type', "Activity Type is required", None, None),
+    ('start_date', "Start Date is required", _parse_date, "Invalid start date format"),
+    ('end_date', None, _parse_date, "Invalid end date format"),
+    ('start_time', None, _parse_time, "Invalid start time format"),
+    ('end_time', None, _parse_time, "Invalid end time format"),
+)
+
+
 class ValidationService:
     """Service for validating form inputs and data"""
 
     @staticmethod
     def validate_email(email: str) -> bool:
         """Validate email address format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        # Shortest address the pattern accepts is a@b.cc
+        if '@' not in email or len(email) < 6:
+            return False
+        return _EMAIL_RE.match(email) is not None
 
     @staticmethod
     def validate_phone_number(phone: str) -> bool:
         """Validate phone number format (basic validation)"""
+        # Stripping separators only shortens the string, so it can't reach 10 digits
+        if len(phone) < 10:
+            return False
+
         # Remove common separators
-        clean_phone = re.sub(r'[\s\-\(\)]', '', phone)
+        clean_phone = phone.translate(_PHONE_STRIP_TABLE)
 
         # Check if it's a valid phone number (10-15 digits)
         return clean_phone.isdigit() and len(clean_phone) >= 10 and len(clean_phone) <= 15
@@ -28,7 +105,7 @@ class ValidationService:
     def validate_date(date_str: str, format_str: str = "%Y-%m-%d") -> bool:
         """Validate date string"""
         try:
-            datetime.strptime(date_str, format_str)
+            _parse_date(date_str, format_str)
             return True
         except ValueError:
             return False
@@ -37,7 +114,7 @@ class ValidationService:
     def validate_time(time_str: str, format_str: str = "%H:%M") -> bool:
         """Validate time string"""
         try:
-            datetime.strptime(time_str, format_str)
+            _parse_time(time_str, format_str)
             return True
         except ValueError:
             return False
@@ -51,15 +128,44 @@ class ValidationService:
             Tuple of (is_valid, error_message)
         """
         try:
-            start = datetime.strptime(start_date, date_format).date()
-            end = datetime.strptime(end_date, date_format).date()
+            start = _parse_date(start_date, date_format)
+            end = _parse_date(end_date, date_format)
+        except ValueError as e:
+            return False, f"Invalid date format: {str(e)}"
 
-            if end < start:
-                return False, "End date cannot be before start date"
+        return ValidationService.validate_date_range_parsed(start, end)
+
+    @staticmethod
+    def validate_date_range_parsed(start: date, end: date) -> Tuple[bool, str]:
+        """Validate an already parsed date range"""
+        if end < start:
+            return False, "End date cannot be before start date"
 
-            return True, ""
+        return True, ""
+
+    @staticmethod
+    def validate_time_range(start_time: str, end_time: str, time_format: str = "%H:%M") -> Tuple[bool, str]:
+        """
+        Validate time range on a single day (end time must be >= start time)
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        try:
+            start = _parse_time(start_time, time_format)
+            end = _parse_time(end_time, time_format)
         except ValueError as e:
-            return False, f"Invalid date format: {str(e)}"
+            return False, f"Invalid time format: {str(e)}"
+
+        return ValidationService.validate_time_range_parsed(start, end)
+
+    @staticmethod
+    def validate_time_range_parsed(start: time, end: time) -> Tuple[bool, str]:
+        """Validate an already parsed time range"""
+        if end < start:
+            return False, "End time cannot be before start time on the same day"
+
+        return True, ""
 
     @staticmethod
     def validate_activity_data(activity_data: Dict[str, Any]) -> List[str]:
@@ -71,39 +177,33 @@ class ValidationService:
         """
         errors = []
 
-        # Required fields
-        required_fields = ['activity_type', 'start_date']
-        for field in required_fields:
-            if not activity_data.get(field):
-                errors.append(f"{field.replace('_', ' ').title()} is required")
-
-        # Validate date format
-        start_date = activity_data.get('start_date')
-        if start_date and not ValidationService.validate_date(start_date):
-            errors.append("Invalid start date format")
+        # Required fields and date/time formats, parsing each value once
+        parsed = {}
+        for field, missing_message, parser, invalid_message in _ACTIVITY_FIELDS:
+            value = activity_data.get(field)
+            if not value:
+                if missing_message:
+                    errors.append(missing_message)
+                continue
 
-        end_date = activity_data.get('end_date')
-        if end_date and not ValidationService.validate_date(end_date):
-            errors.append("Invalid end date format")
+            if parser is not None:
+                parsed[field] = _parse_or_none(parser, value)
+                if parsed[field] is None:
+                    errors.append(invalid_message)
 
         # Validate date range
-        if start_date and end_date:
-            is_valid, error_msg = ValidationService.validate_date_range(start_date, end_date)
+        start = parsed.get('start_date')
+        end = parsed.get('end_date')
+        if start and end:
+            is_valid, error_msg = ValidationService.validate_date_range_parsed(start, end)
             if not is_valid:
                 errors.append(error_msg)
 
-        # Validate time format
-        start_time = activity_data.get('start_time')
-        if start_time and not ValidationService.validate_time(start_time):
-            errors.append("Invalid start time format")
-
-        end_time = activity_data.get('end_time')
-        if end_time and not ValidationService.validate_time(end_time):
-            errors.append("Invalid end time format")
-
         # Validate time range (only if dates are the same)
-        if start_date == end_date and start_time and end_time:
-            is_valid, error_msg = ValidationService.validate_time_range(start_time, end_time)
+        start_clock = parsed.get('start_time')
+        end_clock = parsed.get('end_time')
+        if activity_data.get('start_date') == activity_data.get('end_date') and start_clock and end_clock:
+            is_valid, error_msg = ValidationService.validate_time_range_parsed(start_clock, end_clock)
             if not is_valid:
                 errors.append(error_msg)
 
@@ -126,9 +226,12 @@ class ValidationService:
         # Validate contact info if provided
         contact_info = speaker_data.get('contact_info')
         if contact_info:
-            # Basic validation - check if it looks like email or phone
-            if not (ValidationService.validate_email(contact_info) or
-                   ValidationService.validate_phone_number(contact_info)):
+            # Basic validation - an '@' can only appear in an email, never a phone number
+            if '@' in contact_info:
+                is_valid = ValidationService.validate_email(contact_info)
+            else:
+                is_valid = ValidationService.validate_phone_number(contact_info)
+            if not is_valid:
                 errors.append("Contact information should be a valid email address or phone number")
 
         return errors
@@ -147,11 +250,20 @@ class ValidationService:
         if not participant_data.get('participant_type'):
             errors.append("Participant type is required")
 
-        count = participant_data.get('count', 0)
-        if not isinstance(count, int) or count <= 0:
-            errors.append("Participant count must be a positive integer")
+        # Form fields may hand over the count as a digit string; fractional values are rejected
+        raw_count = participant_data.get('count', 0)
+        if isinstance(raw_count, float) and raw_count.is_integer():
+            count = int(raw_count)
+        elif isinstance(raw_count, int) and not isinstance(raw_count, bool):
+            count = raw_count
+        elif isinstance(raw_count, str) and raw_count.strip().isdecimal():
+            count = int(raw_count)
+        else:
+            count = 0
 
-        if count > 9999:
+        if count <= 0:
+            errors.append("Participant count must be a positive integer")
+        elif count > 9999:
             errors.append("Participant count cannot exceed 9999")
 
         return errors
@@ -176,53 +288,69 @@ class ValidationService:
         return errors
 
     @staticmethod
-    def validate_complete_activity_report(complete_data: Dict[str, Any]) -> Dict[str, Any]:
+    def validate_complete_activity_report(complete_data: Dict[str, Any], fail_fast: bool = False) -> Dict[str, Any]:
         """
         Validate complete activity report data
 
+        Args:
+            complete_data: Activity data including all related tables
+            fail_fast: Stop at the first activity error instead of collecting every error
+
         Returns:
             Dict with validation results containing:
             - valid: bool
             - errors: List of error messages
             - warnings: List of warning messages
         """
-        errors = []
         warnings = []
 
+        # Check the report's shape before validating individual items
+        structure_errors = [
+            f"Report {section.replace('_', ' ')} must be a {expected.__name__}"
+            for section, expected in _REPORT_SECTIONS
+            if not isinstance(complete_data.get(section, expected()), expected)
+        ]
+        if structure_errors:
+            return {'valid': False, 'errors': structure_errors, 'warnings': warnings}
+
         # Validate activity data
         activity = complete_data.get('activity', {})
-        activity_errors = ValidationService.validate_activity_data(activity)
-        errors.extend(activity_errors)
+        errors = ValidationService.validate_activity_data(activity)
+        if errors and fail_fast:
+            return {'valid': False, 'errors': errors[:1], 'warnings': warnings}
 
         # Validate speakers
         speakers = complete_data.get('speakers', [])
         if len(speakers) == 0:
             errors.append("At least one speaker is required")
         else:
-            for i, speaker in enumerate(speakers, 1):
-                speaker_errors = ValidationService.validate_speaker_data(speaker)
-                for error in speaker_errors:
-                    errors.append(f"Speaker {i}: {error}")
+            errors += [
+                f"Speaker {i}: {error}"
+                for i, speaker in enumerate(speakers, 1)
+                for error in ValidationService.validate_speaker_data(speaker)
+            ]
 
         # Validate participants
         participants = complete_data.get('participants', [])
         if len(participants) == 0:
             errors.append("At least one participant type is required")
         else:
-            for i, participant in enumerate(participants, 1):
-                participant_errors = ValidationService.validate_participant_data(participant)
-                for error in participant_errors:
-                    errors.append(f"Participant Type {i}: {error}")
+            errors += [
+                f"Participant Type {i}: {error}"
+                for i, participant in enumerate(participants, 1)
+                for error in ValidationService.validate_participant_data(participant)
+            ]
 
         # Validate report preparers
         preparers = complete_data.get('report_preparers', [])
         if len(preparers) == 0:
             errors.append("At least one report preparer is required")
         else:
-            for i, preparer in enumerate(preparers, 1):
-                preparer_errors = ValidationService.validate_report_preparer_data(preparer)
-                for error in preparer_errors:
-                    errors.append(f"Report Preparer {i}: {error}")
+            errors += [
+                f"Report Preparer {i}: {error}"
+                for i, preparer in enumerate(preparers, 1)
+                for error in ValidationService.validate_report_preparer_data(preparer)
+            ]
 
         # Validate photos (for PDF generation)
         photos = complete_data.get('photos', [])
@@ -2,17 +2,166 @@
 Complete Activity Photos Form
 """
 
+import os
+import functools
+
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QGroupBox, QScrollArea, QMessageBox,
     QFileDialog, QGridLayout, QApplication, QListWidget,
     QListWidgetItem, QAbstractItemView, QSlider, QComboBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QDir, QMimeData
-from PyQt5.QtGui import QFont, QPixmap, QPainter, QDragEnterEvent, QDropEvent
+from PyQt5.QtCore import Qt, pyqtSignal, QDir, QMimeData, QObject, QRunnable, QThreadPool
+from PyQt5.QtGui import QFont, QImage, QImageReader, QPixmap, QPixmapCache, QPainter, QDragEnterEvent, QDropEvent
 
+from ...models.report import ActivityPhoto
 from ...utils.constants import FILE_SIZE_LIMITS, SECTION_LIMITS
 
+# Widget stylesheets
+_STYLE_STATUS_COMPLETE = "color: #27ae60; font-weight: bold;"
+_STYLE_STATUS_INCOMPLETE = "color: #e67e22; font-weight: bold;"
+
+_STYLE_THUMBNAIL = """
+    QLabel {
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        background-color: #f8f9fa;
+    }
+"""
+
+_STYLE_REMOVE_BUTTON = """
+    QPushButton {
+        background-color: #e74c3c;
+        color: white;
+        border: none;
+        border-radius: 10px;
+        font-size: 10px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #c0392b;
+    }
+"""
+
+_STYLE_BROWSE_BUTTON = """
+    QPushButton {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 5px;
+        font-size: 12px;
+        font-weight: bold;
+        margin-top: 10px;
+    }
+    QPushButton:hover {
+        background-color: #2980b9;
+    }
+"""
+
+_STYLE_UPLOAD_AREA = """
+    QFrame {
+        border: 2px dashed #bdc3c7;
+        border-radius: 8px;
+        background-color: #f8f9fa;
+    }
+    QFrame[dragActive="true"], QFrame[dragActive="true"] QFrame {
+        border: 2px dashed #3498db;
+        background-color: #e3f2fd;
+    }
+"""
+
+_STYLE_FORM_CONTAINER = """
+    QFrame {
+        background-color: white;
+        border-radius: 8px;
+        padding: 20px;
+    }
+"""
+
+_STYLE_PHOTOS_SCROLL = """
+    QScrollArea {
+        background-color: transparent;
+        border: 1px solid #ecf0f1;
+        border-radius: 5px;
+    }
+"""
+
+_STYLE_SAVE_BUTTON = """
+    QPushButton {
+        background-color: #3498db;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 5px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #2980b9;
+    }
+"""
+
+@functools.lru_cache(maxsize=None)
+def _font(point_size, weight=-1):
+    """Return a shared Arial font, created on first use once the QApplication exists"""
+    return QFont("Arial", point_size, weight)
+
+@functools.lru_cache(maxsize=512)
+def _image_file_error(file_path, mtime, size, size_limit):
+    """Return why a photo file is rejected, or None if it is a valid image"""
+    # Check file size before decoding anything
+    if size > size_limit:
+        return f"exceeds {size_limit // (1024*1024)}MB limit"
+
+    # Read only the image header to confirm it decodes
+    reader = QImageReader(file_path)
+    if not reader.canRead() or reader.size().isEmpty():
+        return "not a readable image"
+
+    return None
+
+def _thumbnail_cache_key(photo_path):
+    """Return the QPixmapCache key for a photo thumbnail, or None if the file is missing"""
+    try:
+        mtime = os.path.getmtime(photo_path)
+    except OSError:
+        return None
+    return f"thumb:{os.path.abspath(photo_path)}:{mtime}:190x160"
+
+class ThumbnailLoaderSignals(QObject):
+    """Signals emitted by ThumbnailLoader"""
+
+    loaded = pyqtSignal(QImage)
+
+class ThumbnailLoader(QRunnable):
+    """Worker that decodes and scales a photo off the GUI thread"""
+
+    def __init__(self, photo_path):
+        super().__init__()
+        self.photo_path = photo_path
+        self.signals = ThumbnailLoaderSignals()
+
+    def run(self):
+        """Load the scaled thumbnail image"""
+        # QPixmap is GUI-thread only, so decode into a QImage here. Large photos
+        # are decoded straight to about twice the thumbnail size (JPEG scales
+        # during decoding), so the smooth filter only runs over a small image
+        reader = QImageReader(self.photo_path)
+        size = reader.size()
+        if size.isValid() and (size.width() > 380 or size.height() > 320):
+            size.scale(380, 320, Qt.KeepAspectRatio)
+            reader.setScaledSize(size)
+
+        image = reader.read()
+        if not image.isNull():
+            image = image.scaled(
+                190, 160,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+        self.signals.loaded.emit(image)
+
 class PhotoThumbnail(QWidget):
     """Widget for displaying photo thumbnail"""
 
@@ -29,7 +178,8 @@ class PhotoThumbnail(QWidget):
 
     def setup_ui(self):
         """Setup thumbnail widget UI"""
-        layout = QVBoxLayout(self)
+        # Preview and remove button share one grid cell so the button overlays the photo
+        layout = QGridLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         layout.setSpacing(5)
 
@@ -38,54 +188,38 @@ class PhotoThumbnail(QWidget):
         self.photo_label.setAlignment(Qt.AlignCenter)
         self.photo_label.setMinimumSize(140, 140)
         self.photo_label.setMaximumSize(190, 160)
-        self.photo_label.setStyleSheet("""
-            QLabel {
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                background-color: #f8f9fa;
-            }
-        """)
+        self.photo_label.setStyleSheet(_STYLE_THUMBNAIL)
 
-        # Load and display photo
-        pixmap = QPixmap(self.photo_path)
-        if not pixmap.isNull():
-            scaled_pixmap = pixmap.scaled(
-                190, 160,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            self.photo_label.setPixmap(scaled_pixmap)
+        # Show the cached thumbnail, or load it in the background
+        self.cache_key = _thumbnail_cache_key(self.photo_path)
+        cached_pixmap = QPixmapCache.find(self.cache_key) if self.cache_key else None
+        if cached_pixmap is not None and not cached_pixmap.isNull():
+            self.photo_label.setPixmap(cached_pixmap)
+        else:
+            loader = ThumbnailLoader(self.photo_path)
+            loader.signals.loaded.connect(self.on_thumbnail_loaded)
+            QThreadPool.globalInstance().start(loader)
 
-        layout.addWidget(self.photo_label)
+        layout.addWidget(self.photo_label, 0, 0)
 
         # Remove button
         self.remove_button = QPushButton("✕")
         self.remove_button.setFixedSize(20, 20)
-        self.remove_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-size: 10px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
+        self.remove_button.setStyleSheet(_STYLE_REMOVE_BUTTON)
         self.remove_button.clicked.connect(self.remove_requested.emit)
 
-        # Position remove button overlay
-        self.remove_button.setParent(self.photo_label)
-        self.remove_button.move(self.photo_label.width() - 15, 5)
+        # Pin the remove button to the preview's top-right corner
+        layout.addWidget(self.remove_button, 0, 0, Qt.AlignTop | Qt.AlignRight)
+
+    def on_thumbnail_loaded(self, image):
+        """Display a thumbnail decoded by ThumbnailLoader"""
+        if image.isNull():
+            return
 
-    def resizeEvent(self, event):
-        """Handle resize event"""
-        super().resizeEvent(event)
-        # Keep remove button in top-right corner
-        if hasattr(self, 'remove_button') and hasattr(self, 'photo_label'):
-            self.remove_button.move(self.photo_label.width() - 15, 5)
+        scaled_pixmap = QPixmap.fromImage(image)
+        if self.cache_key:
+            QPixmapCache.insert(self.cache_key, scaled_pixmap)
+        self.photo_label.setPixmap(scaled_pixmap)
 
 class PhotoUploadArea(QFrame):
     """Drag and drop area for photo upload"""
@@ -107,93 +241,63 @@ class PhotoUploadArea(QFrame):
 
         # Upload icon and text
         upload_label = QLabel("📷")
-        upload_label.setFont(QFont("Arial", 24))
+        upload_label.setFont(_font(24))
         upload_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(upload_label)
 
         text_label = QLabel("Drag and drop photos here")
-        text_label.setFont(QFont("Arial", 14, QFont.Bold))
+        text_label.setFont(_font(14, QFont.Bold))
         text_label.setAlignment(Qt.AlignCenter)
         text_label.setStyleSheet("color: #7f8c8d;")
         layout.addWidget(text_label)
 
         info_label = QLabel("or click to browse (JPG, PNG - max 5MB each)")
-        info_label.setFont(QFont("Arial", 11))
+        info_label.setFont(_font(11))
         info_label.setAlignment(Qt.AlignCenter)
         info_label.setStyleSheet("color: #95a5a6;")
         layout.addWidget(info_label)
 
         # Browse button
         self.browse_button = QPushButton("Browse Photos")
-        self.browse_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-size: 12px;
-                font-weight: bold;
-                margin-top: 10px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        self.browse_button.setStyleSheet(_STYLE_BROWSE_BUTTON)
         self.browse_button.clicked.connect(self.browse_photos)
         layout.addWidget(self.browse_button)
 
-        # Set style
-        self.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #bdc3c7;
-                border-radius: 8px;
-                background-color: #f8f9fa;
-            }
-        """)
+        # Set style; the drag highlight is switched by the dragActive property
+        self.setProperty("dragActive", False)
+        self.setStyleSheet(_STYLE_UPLOAD_AREA)
 
     def dragEnterEvent(self, event):
         """Handle drag enter event"""
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
-            self.setStyleSheet("""
-                QFrame {
-                    border: 2px dashed #3498db;
-                    border-radius: 8px;
-                    background-color: #e3f2fd;
-                }
-            """)
+            self.set_drag_active(True)
 
     def dragLeaveEvent(self, event):
         """Handle drag leave event"""
-        self.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #bdc3c7;
-                border-radius: 8px;
-                background-color: #f8f9fa;
-            }
-        """)
+        self.set_drag_active(False)
+
+    def set_drag_active(self, active):
+        """Toggle the drag highlight, repolishing only when the state changes"""
+        if self.property("dragActive") == active:
+            return
+
+        self.setProperty("dragActive", active)
+        for widget in (self, *self.findChildren(QWidget)):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
 
     def dropEvent(self, event):
         """Handle drop event"""
-        files = []
-        for url in event.mimeData().urls():
-            if url.isLocalFile():
-                file_path = url.toLocalFile()
-                if self.is_valid_image_file(file_path):
-                    files.append(file_path)
+        files = self.filter_valid_files(
+            url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()
+        )
 
         if files:
             self.photos_uploaded.emit(files)
 
         # Reset style
-        self.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #bdc3c7;
-                border-radius: 8px;
-                background-color: #f8f9fa;
-            }
-        """)
+        self.set_drag_active(False)
 
     def browse_photos(self):
         """Browse for photo files"""
@@ -204,37 +308,41 @@ class PhotoUploadArea(QFrame):
             "Image Files (*.jpg *.jpeg *.png);;All Files (*)"
         )
 
+        valid_files = self.filter_valid_files(file_paths)
+
+        if valid_files:
+            self.photos_uploaded.emit(valid_files)
+
+    def filter_valid_files(self, file_paths):
+        """Return the valid image files, warning once about any that were skipped"""
         valid_files = []
+        rejected = []
         for file_path in file_paths:
-            if self.is_valid_image_file(file_path):
+            is_valid, reason = self.is_valid_image_file(file_path)
+            if is_valid:
                 valid_files.append(file_path)
+            else:
+                rejected.append(f"{os.path.basename(file_path)}: {reason}")
 
-        if valid_files:
-            self.photos_uploaded.emit(valid_files)
+        if rejected:
+            QMessageBox.warning(self, "Files Skipped", "\n".join(rejected))
+
+        return valid_files
 
     def is_valid_image_file(self, file_path):
-        """Check if file is a valid image"""
+        """Check if file is a valid image, returning (is_valid, reason it was rejected)"""
         if not file_path.lower().endswith(('.jpg', '.jpeg', '.png')):
-            return False
+            return False, "only JPG and PNG files are supported"
 
         try:
-            pixmap = QPixmap(file_path)
-            if pixmap.isNull():
-                return False
-
-            # Check file size
-            with open(file_path, 'rb') as f:
-                file_size = len(f.read())
-                if file_size > FILE_SIZE_LIMITS["activity_photo"]:
-                    QMessageBox.warning(
-                        self, "File Too Large",
-                        f"File {file_path.split('/')[-1]} exceeds {FILE_SIZE_LIMITS['activity_photo'] // (1024*1024)}MB limit."
-                    )
-                    return False
-
-            return True
+            # Verdicts are cached until the file's mtime or size changes
+            stat = os.stat(file_path)
+            reason = _image_file_error(
+                file_path, stat.st_mtime, stat.st_size, FILE_SIZE_LIMITS["activity_photo"]
+            )
+            return reason is None, reason
         except Exception:
-            return False
+            return False, "could not be read"
 
 class ActivityPhotosForm(QWidget):
     """Activity Photos form"""
@@ -245,8 +353,7 @@ class ActivityPhotosForm(QWidget):
         super().__init__()
         self.db_service = db_service
         self.activity_id = activity_id
-        self.photos = []  # List of (photo_path, photo_type, caption)
-        self.photo_widgets = []
+        self.photos = {}  # Photo widget -> ActivityPhoto, in display order
 
         self.setup_ui()
         self.setup_connections()
@@ -263,25 +370,19 @@ class ActivityPhotosForm(QWidget):
         # Form container
         form_container = QFrame()
         form_container.setFrameStyle(QFrame.Box)
-        form_container.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 8px;
-                padding: 20px;
-            }
-        """)
+        form_container.setStyleSheet(_STYLE_FORM_CONTAINER)
         form_layout = QVBoxLayout(form_container)
 
         # Form title and status
         header_layout = QHBoxLayout()
         title_label = QLabel("Activity Photos")
-        title_label.setFont(QFont("Arial", 16, QFont.Bold))
+        title_label.setFont(_font(16, QFont.Bold))
         title_label.setStyleSheet("color: #2c3e50;")
         header_layout.addWidget(title_label)
 
         self.status_label = QLabel("0 photos uploaded")
-        self.status_label.setFont(QFont("Arial", 12))
-        self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+        self.status_label.setFont(_font(12))
+        self.status_label.setStyleSheet(_STYLE_STATUS_COMPLETE)
         header_layout.addWidget(self.status_label)
         header_layout.addStretch()
 
@@ -299,26 +400,20 @@ class ActivityPhotosForm(QWidget):
 
         # Photos display area
         photos_group = QGroupBox("Uploaded Photos")
-        photos_group.setFont(QFont("Arial", 12, QFont.Bold))
+        photos_group.setFont(_font(12, QFont.Bold))
         photos_layout = QVBoxLayout(photos_group)
 
         # Photos container with scroll area
         self.photos_scroll = QScrollArea()
         self.photos_scroll.setWidgetResizable(True)
         self.photos_scroll.setFrameStyle(QFrame.NoFrame)
-        self.photos_scroll.setStyleSheet("""
-            QScrollArea {
-                background-color: transparent;
-                border: 1px solid #ecf0f1;
-                border-radius: 5px;
-            }
-        """)
+        self.photos_scroll.setStyleSheet(_STYLE_PHOTOS_SCROLL)
         self.photos_scroll.setMinimumHeight(200)
 
         self.photos_container = QWidget()
         self.photos_layout = QHBoxLayout(self.photos_container)
         self.photos_layout.setSpacing(10)
-        self.photos_layout.addStretch()
+        self.photos_layout.setAlignment(Qt.AlignLeft)
 
         self.photos_scroll.setWidget(self.photos_container)
         photos_layout.addWidget(self.photos_scroll)
@@ -330,20 +425,7 @@ class ActivityPhotosForm(QWidget):
         actions_layout.addStretch()
 
         self.save_button = QPushButton("Save Photos")
-        self.save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        self.save_button.setStyleSheet(_STYLE_SAVE_BUTTON)
         self.save_button.clicked.connect(self.save_data)
         actions_layout.addWidget(self.save_button)
 
@@ -356,28 +438,33 @@ class ActivityPhotosForm(QWidget):
 
     def add_photos(self, photo_paths):
         """Add photos to the form"""
-        for photo_path in photo_paths:
-            if len(self.photos) >= SECTION_LIMITS["max_photos"]:
-                QMessageBox.warning(
-                    self, "Limit Reached",
-                    f"Maximum {SECTION_LIMITS['max_photos']} photos allowed."
-                )
-                break
+        # Lay the batch out once instead of after every photo
+        self.photos_container.setUpdatesEnabled(False)
+        try:
+            for photo_path in photo_paths:
+                if len(self.photos) >= SECTION_LIMITS["max_photos"]:
+                    QMessageBox.warning(
+                        self, "Limit Reached",
+                        f"Maximum {SECTION_LIMITS['max_photos']} photos allowed."
+                    )
+                    break
 
-            # Create photo widget
-            photo_type = "activity"
-            caption = ""
+                # Create photo widget
+                photo_type = "activity"
+                caption = ""
 
-            photo_widget = PhotoThumbnail(photo_path, photo_type, caption)
-            photo_widget.remove_requested.connect(lambda: self.remove_photo(photo_widget))
+                photo_widget = PhotoThumbnail(photo_path, photo_type, caption)
+                photo_widget.remove_requested.connect(lambda widget=photo_widget: self.remove_photo(widget))
 
-            # Insert before stretch
-            index = self.photos_layout.count() - 1
-            self.photos_layout.insertWidget(index, photo_widget)
+                self.photos_layout.addWidget(photo_widget)
 
-            # Add to photos list
-            self.photos.append((photo_path, photo_type, caption))
-            self.photo_widgets.append(photo_widget)
+                # Add to photos
+                self.photos[photo_widget] = ActivityPhoto(
+                    photo_path=photo_path, activity_id=self.activity_id,
+                    photo_type=photo_type, caption=caption
+                )
+        finally:
+            self.photos_container.setUpdatesEnabled(True)
 
         self.update_status()
         self.data_changed.emit()
@@ -391,11 +478,7 @@ class ActivityPhotosForm(QWidget):
             )
             return
 
-        if photo_widget in self.photo_widgets:
-            index = self.photo_widgets.index(photo_widget)
-            del self.photos[index]
-            self.photo_widgets.remove(photo_widget)
-
+        if self.photos.pop(photo_widget, None) is not None:
             photo_widget.setParent(None)
             photo_widget.deleteLater()
 
@@ -409,9 +492,9 @@ class ActivityPhotosForm(QWidget):
 
         # Change color based on requirements
         if count >= SECTION_LIMITS["min_photos"]:
-            self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+            self.status_label.setStyleSheet(_STYLE_STATUS_COMPLETE)
         else:
-            self.status_label.setStyleSheet(f"color: #e67e22; font-weight: bold;")
+            self.status_label.setStyleSheet(_STYLE_STATUS_INCOMPLETE)
 
     def validate_form(self):
         """Validate form inputs"""
@@ -424,14 +507,14 @@ class ActivityPhotosForm(QWidget):
 
     def get_form_data(self):
         """Get form data as dictionary"""
-        photos_data = []
-        for photo_path, photo_type, caption in self.photos:
-            photos_data.append({
-                'photo_path': photo_path,
-                'photo_type': photo_type,
-                'caption': caption
-            })
-        return photos_data
+        return [
+            {
+                'photo_path': photo.photo_path,
+                'photo_type': photo.photo_type,
+                'caption': photo.caption
+            }
+            for photo in self.photos.values()
+        ]
 
     def save_data(self):
         """Save form data to database"""
@@ -446,11 +529,8 @@ class ActivityPhotosForm(QWidget):
                 QMessageBox.warning(self, "Validation Error", "\n".join(errors))
                 return False
 
-            # Get photos data
-            photos_data = self.get_form_data()
-
-            # Save to database
-            self.db_service.save_activity_photos(self.activity_id, photos_data)
+            # Save the photo records directly; no dict round-trip needed
+            self.db_service.save_activity_photos(self.activity_id, list(self.photos.values()))
 
             QMessageBox.information(self, "Success", "Activity photos saved successfully!")
             self.data_changed.emit()
@@ -467,6 +547,7 @@ class ActivityPhotosForm(QWidget):
 
         try:
             photos = self.db_service.get_activity_photos(self.activity_id)
+            self.photos_container.setUpdatesEnabled(False)
             for photo_data in photos:
                 if len(self.photos) >= SECTION_LIMITS["max_photos"]:
                     break
@@ -476,19 +557,21 @@ class ActivityPhotosForm(QWidget):
                 caption = photo_data.get('caption', '')
 
                 photo_widget = PhotoThumbnail(photo_path, photo_type, caption)
-                photo_widget.remove_requested.connect(lambda: self.remove_photo(photo_widget))
+                photo_widget.remove_requested.connect(lambda widget=photo_widget: self.remove_photo(widget))
 
-                # Insert before stretch
-                index = self.photos_layout.count() - 1
-                self.photos_layout.insertWidget(index, photo_widget)
+                self.photos_layout.addWidget(photo_widget)
 
-                self.photos.append((photo_path, photo_type, caption))
-                self.photo_widgets.append(photo_widget)
+                self.photos[photo_widget] = ActivityPhoto(
+                    photo_path=photo_path, activity_id=self.activity_id,
+                    photo_type=photo_type, caption=caption
+                )
 
             self.update_status()
 
         except Exception as e:
             QMessageBox.warning(self, "Warning", f"Failed to load data: {str(e)}")
+        finally:
+            self.photos_container.setUpdatesEnabled(True)
 
     def set_activity_id(self, activity_id):
         """Set the current activity ID"""
@@ -501,9 +584,8 @@ class ActivityPhotosForm(QWidget):
     def clear_form(self):
         """Clear all form fields"""
         # Remove all photo widgets
-        for photo_widget in self.photo_widgets[:]:
+        for photo_widget in list(self.photos):
             self.remove_photo(photo_widget)
 
         self.photos.clear()
-        self.photo_widgets.clear()
         self.update_status()
\ No newline at end of file
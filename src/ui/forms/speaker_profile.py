@@ -488,23 +488,21 @@ class SpeakerProfileForm(QWidget):
             # Get profiles data
             profiles_data = self.get_form_data()
 
-            # Update speaker profiles in database
-            for profile_data in profiles_data:
-                speaker_id = profile_data.get('id')
-                if speaker_id:
-                    # Update existing speaker
-                    self.db_service.get_connection().execute('''
-                        UPDATE speakers SET
-                            profile_image_path=?, profile_text=?
-                        WHERE id=?
-                    ''', (
-                        profile_data.get('profile_image_path'),
-                        profile_data.get('profile_text'),
-                        speaker_id
-                    ))
-
-            # Commit changes
-            self.db_service.get_connection().commit()
+            # Update speaker profiles in database (committed together)
+            with self.db_service.transaction() as conn:
+                for profile_data in profiles_data:
+                    speaker_id = profile_data.get('id')
+                    if speaker_id:
+                        # Update existing speaker
+                        conn.execute('''
+                            UPDATE speakers SET
+                                profile_image_path=?, profile_text=?
+                            WHERE id=?
+                        ''', (
+                            profile_data.get('profile_image_path'),
+                            profile_data.get('profile_text'),
+                            speaker_id
+                        ))
 
             QMessageBox.information(self, "Success", "Speaker profiles saved successfully!")
             self.data_changed.emit()
@@ -45,6 +45,13 @@ PARTICIPANT_TYPES = [
     ("research_scholar", "Research Scholar")
 ]
 
+# Plural participant type labels used in reports
+PARTICIPANT_TYPE_DISPLAY = {
+    "faculty": "Faculty",
+    "student": "Students",
+    "research_scholar": "Research Scholars"
+}
+
 # Photo types
 PHOTO_TYPES = [
     ("activity", "Activity Photo"),